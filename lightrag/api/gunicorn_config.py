@@ -2,7 +2,12 @@
 import os
 import logging
 from lightrag.kg.shared_storage import finalize_share_data
-from lightrag.utils import setup_logger, get_env_value
+from lightrag.utils import (
+    setup_logger,
+    get_env_value,
+    install_queue_logging,
+    stop_queue_logging,
+)
 from lightrag.constants import (
     DEFAULT_LOG_MAX_BYTES,
     DEFAULT_LOG_BACKUP_COUNT,
@@ -149,14 +154,27 @@ def post_fork(server, worker):
         "uvicorn.access", log_level, add_filter=True, log_file_path=log_file_path
     )
     setup_logger("lightrag", log_level, add_filter=True, log_file_path=log_file_path)
+    queued_loggers = ["uvicorn", "uvicorn.access", "lightrag"]
 
     # Set up lightrag submodule loggers
-    for name in logging.root.manager.loggerDict:
+    for name in list(logging.root.manager.loggerDict):
         if name.startswith("lightrag."):
             setup_logger(name, log_level, add_filter=True, log_file_path=log_file_path)
+            queued_loggers.append(name)
+
+    # Hand console/file writes to a per-worker listener thread
+    install_queue_logging(queued_loggers)
 
     # Disable uvicorn.error logger
     uvicorn_error_logger = logging.getLogger("uvicorn.error")
     uvicorn_error_logger.handlers = []
     uvicorn_error_logger.setLevel(logging.CRITICAL)
     uvicorn_error_logger.propagate = False
+
+
+def worker_exit(server, worker):
+    """
+    Executed in the worker process just before it exits.
+    Flush log records still queued for the listener thread.
+    """
+    stop_queue_logging()
@@ -10,6 +10,7 @@ from fastapi.openapi.docs import (
     get_swagger_ui_oauth2_redirect_html,
 )
 import os
+import secrets
 import logging
 import logging.config
 import sys
@@ -53,7 +54,7 @@ from lightrag.api.routers.query_routes import create_query_routes
 from lightrag.api.routers.graph_routes import create_graph_routes
 from lightrag.api.routers.ollama_api import OllamaAPI
 
-from lightrag.utils import logger, set_verbose_debug
+from lightrag.utils import logger, set_verbose_debug, install_queue_logging
 from lightrag.kg.shared_storage import (
     get_namespace_data,
     get_default_workspace,
@@ -1181,7 +1182,11 @@ def create_app(args):
                 "webui_description": webui_description,
             }
         username = form_data.username
-        if auth_handler.accounts.get(username) != form_data.password:
+        expected_password = auth_handler.accounts.get(username)
+        # Constant-time comparison to avoid leaking the password through timing
+        if expected_password is None or not secrets.compare_digest(
+            expected_password.encode("utf-8"), form_data.password.encode("utf-8")
+        ):
             raise HTTPException(status_code=401, detail="Incorrect credentials")
 
         # Regular user login
@@ -1454,6 +1459,8 @@ def configure_logging():
         }
     )
 
+    install_queue_logging(["uvicorn", "uvicorn.access", "uvicorn.error", "lightrag"])
+
 
 def check_and_install_dependencies():
     """Check and install required dependencies"""
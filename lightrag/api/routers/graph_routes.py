@@ -7,6 +7,7 @@ import traceback
 from fastapi import APIRouter, Depends, Query, HTTPException
 from pydantic import BaseModel, Field
 
+from lightrag.types import KnowledgeGraph
 from lightrag.utils import logger
 from ..utils_api import get_combined_auth_dependency
 
@@ -156,7 +157,11 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
                 status_code=500, detail=f"Error searching labels: {str(e)}"
             )
 
-    @router.get("/graphs", dependencies=[Depends(combined_auth)])
+    @router.get(
+        "/graphs",
+        response_model=KnowledgeGraph,
+        dependencies=[Depends(combined_auth)],
+    )
     async def get_knowledge_graph(
         label: str = Query(..., description="Label to get knowledge graph for"),
         max_depth: int = Query(3, description="Maximum depth of graph", ge=1),
@@ -174,7 +179,7 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
             max_nodes: Maxiumu nodes to return
 
         Returns:
-            Dict[str, List[str]]: Knowledge graph for label
+            KnowledgeGraph: Knowledge graph for label
         """
         try:
             # Log the label parameter to check for leading spaces
@@ -4,6 +4,7 @@ Utility functions for the LightRAG API.
 
 import os
 import argparse
+import secrets
 from typing import Optional, List, Tuple
 import sys
 import time
@@ -237,7 +238,10 @@ def get_combined_auth_dependency(api_key: Optional[str] = None):
         if (
             api_key_configured
             and api_key_header_value
-            and api_key_header_value == api_key
+            # Constant-time comparison to avoid leaking the key through timing
+            and secrets.compare_digest(
+                api_key_header_value.encode("utf-8"), api_key.encode("utf-8")
+            )
         ):
             return  # API key validation successful
 
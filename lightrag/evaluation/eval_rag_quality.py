@@ -869,12 +869,13 @@ class RAGEvaluator:
     async def run(self) -> Dict[str, Any]:
         """Run complete evaluation pipeline"""
 
-        start_time = time.time()
+        # Monotonic clock so the elapsed time is immune to wall-clock adjustments
+        start_time = time.perf_counter()
 
         # Evaluate responses
         results = await self.evaluate_responses()
 
-        elapsed_time = time.time() - start_time
+        elapsed_time = time.perf_counter() - start_time
 
         # Calculate benchmark statistics
         benchmark_stats = self._calculate_benchmark_stats(results)
@@ -173,8 +173,11 @@ class FaissVectorDBStorage(BaseVectorStorage):
         # Step 3: Store metadata + vector for each new ID
         for i, meta in enumerate(list_data):
             fid = start_idx + i
-            # Store the raw vector so we can rebuild if something is removed
-            meta["__vector__"] = embeddings[i].tolist()
+            # Store the raw vector so we can rebuild if something is removed.
+            # Kept as a float32 array rather than a list of Python floats, which
+            # would take several times the memory. Copied so the row does not
+            # keep the whole batch array alive.
+            meta["__vector__"] = embeddings[i].copy()
             self._id_to_meta.update({fid: meta})
 
         logger.debug(
@@ -323,7 +326,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
             if "__vector__" in vec_meta:
                 vec = vec_meta["__vector__"]
             elif old_fid < self._index.ntotal:
-                vec = self._index.reconstruct(old_fid).tolist()
+                vec = self._index.reconstruct(old_fid)
                 vec_meta["__vector__"] = vec
             else:
                 logger.warning(
@@ -406,7 +409,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                     )
                     continue
                 if "__vector__" not in meta:
-                    meta["__vector__"] = self._index.reconstruct(fid).tolist()
+                    meta["__vector__"] = self._index.reconstruct(fid)
                 self._id_to_meta[fid] = meta
 
             logger.info(
@@ -533,7 +536,7 @@ class FaissVectorDBStorage(BaseVectorStorage):
                 metadata = self._id_to_meta[fid]
                 # Get the stored vector from metadata
                 if "__vector__" in metadata:
-                    vectors_dict[id] = metadata["__vector__"]
+                    vectors_dict[id] = np.asarray(metadata["__vector__"]).tolist()
 
         return vectors_dict
 
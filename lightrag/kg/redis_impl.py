@@ -281,12 +281,14 @@ class RedisKVStorage(BaseKVStorage):
 
     @redis_retry
     async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any]]:
+        if not ids:
+            return []
         async with self._get_redis_connection() as redis:
             try:
-                pipe = redis.pipeline()
-                for id in ids:
-                    pipe.get(f"{self.final_namespace}:{id}")
-                results = await pipe.execute()
+                # Single MGET round-trip; missing keys come back as None
+                results = await redis.mget(
+                    [f"{self.final_namespace}:{id}" for id in ids]
+                )
 
                 processed_results = []
                 for result in results:
@@ -663,12 +665,14 @@ class RedisDocStatusStorage(DocStatusStorage):
 
     async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any]]:
         ordered_results: list[dict[str, Any] | None] = []
+        if not ids:
+            return ordered_results
         async with self._get_redis_connection() as redis:
             try:
-                pipe = redis.pipeline()
-                for id in ids:
-                    pipe.get(f"{self.final_namespace}:{id}")
-                results = await pipe.execute()
+                # Single MGET round-trip; missing keys come back as None
+                results = await redis.mget(
+                    [f"{self.final_namespace}:{id}" for id in ids]
+                )
 
                 for result_data in results:
                     if result_data:
@@ -698,10 +702,7 @@ class RedisDocStatusStorage(DocStatusStorage):
                     )
                     if keys:
                         # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
+                        values = await redis.mget(keys)
 
                         # Count statuses
                         for value in values:
@@ -736,10 +737,7 @@ class RedisDocStatusStorage(DocStatusStorage):
                     )
                     if keys:
                         # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
+                        values = await redis.mget(keys)
 
                         # Filter by status and create DocProcessingStatus objects
                         for key, value in zip(keys, values):
@@ -792,10 +790,7 @@ class RedisDocStatusStorage(DocStatusStorage):
                     )
                     if keys:
                         # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
+                        values = await redis.mget(keys)
 
                         # Filter by track_id and create DocProcessingStatus objects
                         for key, value in zip(keys, values):
@@ -952,10 +947,7 @@ class RedisDocStatusStorage(DocStatusStorage):
                     )
                     if keys:
                         # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
+                        values = await redis.mget(keys)
 
                         # Process documents
                         for key, value in zip(keys, values):
@@ -1060,10 +1052,7 @@ class RedisDocStatusStorage(DocStatusStorage):
                     )
                     if keys:
                         # Get all values in batch
-                        pipe = redis.pipeline()
-                        for key in keys:
-                            pipe.get(key)
-                        values = await pipe.execute()
+                        values = await redis.mget(keys)
 
                         # Check each document for matching file_path
                         for value in values:
@@ -3594,31 +3594,48 @@ async def _perform_kg_search(
         )
 
     else:  # hybrid or mix mode
-        if len(ll_keywords) > 0:
-            local_entities, local_relations = await _get_node_data(
-                ll_keywords,
-                knowledge_graph_inst,
-                entities_vdb,
-                query_param,
-                query_embedding=ll_embedding,
-            )
-        if len(hl_keywords) > 0:
-            global_relations, global_entities = await _get_edge_data(
-                hl_keywords,
-                knowledge_graph_inst,
-                relationships_vdb,
-                query_param,
-                query_embedding=hl_embedding,
-            )
+        # Local, global and vector retrievals only read storage and do not
+        # depend on each other, so run them concurrently
+        async def _local_search():
+            if len(ll_keywords) > 0:
+                return await _get_node_data(
+                    ll_keywords,
+                    knowledge_graph_inst,
+                    entities_vdb,
+                    query_param,
+                    query_embedding=ll_embedding,
+                )
+            return [], []
 
-        # Get vector chunks for mix mode
-        if query_param.mode == "mix" and chunks_vdb:
-            vector_chunks = await _get_vector_context(
-                query,
-                chunks_vdb,
-                query_param,
-                query_embedding,
-            )
+        async def _global_search():
+            if len(hl_keywords) > 0:
+                return await _get_edge_data(
+                    hl_keywords,
+                    knowledge_graph_inst,
+                    relationships_vdb,
+                    query_param,
+                    query_embedding=hl_embedding,
+                )
+            return [], []
+
+        async def _vector_search():
+            # Get vector chunks for mix mode
+            if query_param.mode == "mix" and chunks_vdb:
+                return await _get_vector_context(
+                    query,
+                    chunks_vdb,
+                    query_param,
+                    query_embedding,
+                )
+            return []
+
+        (
+            (local_entities, local_relations),
+            (global_relations, global_entities),
+            vector_chunks,
+        ) = await asyncio.gather(_local_search(), _global_search(), _vector_search())
+
+        if vector_chunks:
             # Track vector chunks with source metadata
             for i, chunk in enumerate(vector_chunks):
                 chunk_id = chunk.get("chunk_id") or chunk.get("id")
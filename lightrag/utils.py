@@ -10,6 +10,8 @@ import inspect
 import json
 import logging
 import logging.handlers
+import atexit
+import queue
 import os
 import re
 import time
@@ -276,17 +278,18 @@ statistic_data = {"llm_call": 0, "llm_cache": 0, "embed_call": 0}
 class LightragPathFilter(logging.Filter):
     """Filter for lightrag logger to filter out frequent path access logs"""
 
-    def __init__(self):
-        super().__init__()
-        # Define paths to be filtered
-        self.filtered_paths = [
+    # Paths to be filtered; frozensets keep the per-record checks O(1)
+    FILTERED_PATHS = frozenset(
+        {
             "/documents",
             "/documents/paginated",
             "/health",
             "/webui/",
             "/documents/pipeline_status",
-        ]
-        # self.filtered_paths = ["/health", "/webui/"]
+        }
+    )
+    FILTERED_METHODS = frozenset({"GET", "POST"})
+    FILTERED_STATUSES = frozenset({200, 304})
 
     def filter(self, record):
         try:
@@ -303,9 +306,9 @@ class LightragPathFilter(logging.Filter):
 
             # Filter out successful GET/POST requests to filtered paths
             if (
-                (method == "GET" or method == "POST")
-                and (status == 200 or status == 304)
-                and path in self.filtered_paths
+                path in self.FILTERED_PATHS
+                and method in self.FILTERED_METHODS
+                and status in self.FILTERED_STATUSES
             ):
                 return False
 
@@ -385,6 +388,62 @@ def setup_logger(
         logger_instance.addFilter(path_filter)
 
 
+# Background listeners draining records queued by install_queue_logging()
+_log_queue_listeners: list[logging.handlers.QueueListener] = []
+# Logger -> (installed QueueHandler, original handlers) for restoring on stop
+_queued_logger_handlers: dict[
+    logging.Logger, tuple[logging.Handler, list[logging.Handler]]
+] = {}
+
+
+def stop_queue_logging():
+    """Restore the original handlers, then flush and stop the listeners"""
+    while _queued_logger_handlers:
+        logger_instance, (queue_handler, handlers) = _queued_logger_handlers.popitem()
+        # Swap back in place; loggers reconfigured after install are left alone
+        if queue_handler in logger_instance.handlers:
+            index = logger_instance.handlers.index(queue_handler)
+            logger_instance.handlers[index : index + 1] = handlers
+    while _log_queue_listeners:
+        _log_queue_listeners.pop().stop()
+
+
+def install_queue_logging(logger_names: list[str]):
+    """Route the given loggers through QueueHandlers.
+
+    Emitting a record only enqueues it; console and file writes happen on
+    QueueListener threads so they never block the event loop. Loggers sharing
+    the same handlers share one queue, so each record is still written once
+    per handler. Loggers queued by a previous call get their original
+    handlers back first.
+    """
+    stop_queue_logging()
+
+    groups: dict[tuple[logging.Handler, ...], list[logging.Logger]] = {}
+    for name in logger_names:
+        logger_instance = logging.getLogger(name)
+        if logger_instance.handlers:
+            groups.setdefault(tuple(logger_instance.handlers), []).append(
+                logger_instance
+            )
+
+    for handlers, loggers in groups.items():
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        for logger_instance in loggers:
+            logger_instance.handlers = [queue_handler]
+            _queued_logger_handlers[logger_instance] = (queue_handler, list(handlers))
+
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        _log_queue_listeners.append(listener)
+
+
+atexit.register(stop_queue_logging)
+
+
 class UnlimitedSemaphore:
     """A context manager that allows unlimited access."""
 
@@ -2518,29 +2577,43 @@ async def pick_by_vector_similarity(
                 )
             return []
 
-        # Calculate cosine similarities
-        similarities = []
-        valid_vectors = 0
+        # Calculate cosine similarities for all chunks with one matrix-vector product.
+        # Vectors that cannot be stacked (non-numeric or wrong dimension) are
+        # skipped individually so one bad vector does not discard the ranking.
+        query_vector = np.asarray(query_embedding, dtype=np.float64).reshape(-1)
+        candidate_ids = []
+        candidate_vectors = []
         for chunk_id in all_chunk_ids:
-            if chunk_id in chunk_vectors:
-                chunk_embedding = chunk_vectors[chunk_id]
-                try:
-                    # Calculate cosine similarity
-                    similarity = cosine_similarity(query_embedding, chunk_embedding)
-                    similarities.append((chunk_id, similarity))
-                    valid_vectors += 1
-                except Exception as e:
-                    logger.warning(
-                        f"Vector similarity chunk selection: failed to calculate similarity for chunk {chunk_id}: {e}"
+            try:
+                chunk_embedding = np.asarray(
+                    chunk_vectors[chunk_id], dtype=np.float64
+                ).reshape(-1)
+                if chunk_embedding.shape != query_vector.shape:
+                    raise ValueError(
+                        f"dimension {chunk_embedding.shape[0]} does not match query dimension {query_vector.shape[0]}"
                     )
-            else:
+            except Exception as e:
                 logger.warning(
-                    f"Vector similarity chunk selection:  no vector found for chunk {chunk_id}"
+                    f"Vector similarity chunk selection: failed to calculate similarity for chunk {chunk_id}: {e}"
                 )
+                continue
+            candidate_ids.append(chunk_id)
+            candidate_vectors.append(chunk_embedding)
+
+        if not candidate_ids:
+            return []
+
+        chunk_matrix = np.vstack(candidate_vectors)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            similarities = (chunk_matrix @ query_vector) / (
+                np.linalg.norm(chunk_matrix, axis=1) * np.linalg.norm(query_vector)
+            )
+        # Zero-norm vectors produce NaN; rank them last
+        similarities = np.nan_to_num(similarities, nan=-np.inf)
 
-        # Sort by similarity (highest first) and select top num_of_chunks
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        selected_chunks = [chunk_id for chunk_id, _ in similarities[:num_of_chunks]]
+        # Sort by similarity (highest first, stable for ties) and select top num_of_chunks
+        top_indices = np.argsort(-similarities, kind="stable")[:num_of_chunks]
+        selected_chunks = [candidate_ids[i] for i in top_indices]
 
         logger.debug(
             f"Vector similarity chunk selection: {len(selected_chunks)} chunks from {len(all_chunk_ids)} candidates"
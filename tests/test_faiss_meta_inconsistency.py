@@ -161,3 +161,71 @@ class TestFaissMetaInconsistency:
             with open(meta_file, "r", encoding="utf-8") as f:
                 loaded = json.load(f)
             assert loaded == serializable_dict
+
+
+_VECTORS = {
+    "doc a": [3.0, 4.0, 0.0, 0.0],
+    "doc b": [0.0, 0.0, 1.0, 0.0],
+    "doc c": [0.0, 1.0, 0.0, 1.0],
+    "doc c v2": [1.0, 0.0, 0.0, 0.0],
+}
+
+
+async def _fake_embed(texts, **kwargs):
+    return np.array([_VECTORS[t] for t in texts], dtype=np.float64)
+
+
+@pytest.mark.offline
+class TestFaissStoredVectors:
+    """Test the per-row vectors kept in _id_to_meta on the real storage class."""
+
+    @pytest.fixture
+    async def storage(self, tmp_path):
+        from lightrag.kg.faiss_impl import FaissVectorDBStorage
+        from lightrag.kg.shared_storage import (
+            finalize_share_data,
+            initialize_share_data,
+        )
+        from lightrag.utils import EmbeddingFunc
+
+        initialize_share_data()
+        storage = FaissVectorDBStorage(
+            namespace="chunks",
+            workspace="",
+            global_config={
+                "embedding_batch_num": 10,
+                "vector_db_storage_cls_kwargs": {"cosine_better_than_threshold": 0.2},
+                "working_dir": str(tmp_path),
+            },
+            embedding_func=EmbeddingFunc(embedding_dim=4, func=_fake_embed),
+        )
+        await storage.initialize()
+        yield storage
+        finalize_share_data()
+
+    async def test_upsert_delete_rebuild_returns_float_lists(self, storage):
+        await storage.upsert(
+            {
+                "a": {"content": "doc a"},
+                "b": {"content": "doc b"},
+                "c": {"content": "doc c"},
+            }
+        )
+
+        # Each row owns its data instead of viewing the whole upsert batch
+        for meta in storage._id_to_meta.values():
+            assert meta["__vector__"].base is None
+
+        # delete() and re-upsert both rebuild the index from the stored rows
+        await storage.delete(["b"])
+        await storage.upsert({"c": {"content": "doc c v2"}})
+
+        vectors = await storage.get_vectors_by_ids(["a", "b", "c"])
+
+        assert set(vectors) == {"a", "c"}
+        for vector in vectors.values():
+            assert isinstance(vector, list)
+            assert all(type(x) is float for x in vector)
+        assert vectors["a"] == pytest.approx([0.6, 0.8, 0.0, 0.0])
+        assert vectors["c"] == pytest.approx([1.0, 0.0, 0.0, 0.0])
+        assert storage._index.ntotal == 2
@@ -0,0 +1,177 @@
+"""
+Tests for the concurrent local/global/vector retrieval in _perform_kg_search().
+
+The hybrid and mix branches run _get_node_data, _get_edge_data and
+_get_vector_context with asyncio.gather. These tests check that the three
+retrievals are in flight together and pin the merged output so that
+completion order of the retrievals never leaks into the results.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lightrag import operate
+from lightrag.base import QueryParam
+
+# Mark all tests as offline (no external dependencies)
+pytestmark = pytest.mark.offline
+
+
+LOCAL_ENTITIES = [{"entity_name": "A"}, {"entity_name": "B"}, {"entity_name": "C"}]
+LOCAL_RELATIONS = [{"src_tgt": ("A", "B")}, {"src_tgt": ("B", "C")}]
+GLOBAL_ENTITIES = [{"entity_name": "B"}, {"entity_name": "D"}]
+GLOBAL_RELATIONS = [
+    {"src_id": "B", "tgt_id": "A"},
+    {"src_id": "D", "tgt_id": "E"},
+    {"src_id": "E", "tgt_id": "F"},
+]
+VECTOR_CHUNKS = [{"chunk_id": "chunk-1"}, {"id": "chunk-2"}, {"content": "no id"}]
+
+
+@pytest.fixture
+def stub_retrievals(monkeypatch):
+    """Stub the three retrievals; local is slowest so global/vector finish first."""
+
+    async def fake_get_node_data(*args, **kwargs):
+        await asyncio.sleep(0.02)
+        return list(LOCAL_ENTITIES), list(LOCAL_RELATIONS)
+
+    async def fake_get_edge_data(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return list(GLOBAL_RELATIONS), list(GLOBAL_ENTITIES)
+
+    async def fake_get_vector_context(*args, **kwargs):
+        return list(VECTOR_CHUNKS)
+
+    stubs = {
+        "_get_node_data": AsyncMock(side_effect=fake_get_node_data),
+        "_get_edge_data": AsyncMock(side_effect=fake_get_edge_data),
+        "_get_vector_context": AsyncMock(side_effect=fake_get_vector_context),
+    }
+    for name, stub in stubs.items():
+        monkeypatch.setattr(operate, name, stub)
+    return stubs
+
+
+def _make_text_chunks_db():
+    mock = MagicMock()
+    mock.embedding_func = None
+    mock.global_config = {}
+    return mock
+
+
+async def _search(mode, ll_keywords="entity1", hl_keywords="theme1", chunks_vdb=None):
+    return await operate._perform_kg_search(
+        query="test query",
+        ll_keywords=ll_keywords,
+        hl_keywords=hl_keywords,
+        knowledge_graph_inst=AsyncMock(),
+        entities_vdb=AsyncMock(),
+        relationships_vdb=AsyncMock(),
+        text_chunks_db=_make_text_chunks_db(),
+        query_param=QueryParam(mode=mode, top_k=5),
+        chunks_vdb=chunks_vdb,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["hybrid", "mix"])
+async def test_round_robin_merge_order_is_preserved(stub_retrievals, mode):
+    result = await _search(mode, chunks_vdb=AsyncMock())
+
+    assert [e["entity_name"] for e in result["final_entities"]] == [
+        "A",
+        "B",
+        "D",
+        "C",
+    ]
+    assert result["final_relations"] == [
+        {"src_tgt": ("A", "B")},
+        {"src_tgt": ("B", "C")},
+        {"src_id": "D", "tgt_id": "E"},
+        {"src_id": "E", "tgt_id": "F"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mix_mode_tracks_vector_chunks(stub_retrievals):
+    result = await _search("mix", chunks_vdb=AsyncMock())
+
+    stub_retrievals["_get_vector_context"].assert_awaited_once()
+    assert result["vector_chunks"] == VECTOR_CHUNKS
+    assert result["chunk_tracking"] == {
+        "chunk-1": {"source": "C", "frequency": 1, "order": 1},
+        "chunk-2": {"source": "C", "frequency": 1, "order": 2},
+    }
+
+
+@pytest.mark.asyncio
+async def test_hybrid_mode_skips_vector_search(stub_retrievals):
+    result = await _search("hybrid", chunks_vdb=AsyncMock())
+
+    stub_retrievals["_get_vector_context"].assert_not_called()
+    assert result["vector_chunks"] == []
+    assert result["chunk_tracking"] == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["hybrid", "mix"])
+async def test_empty_keywords_produce_empty_lists(stub_retrievals, mode):
+    result = await _search(mode, ll_keywords="", hl_keywords="")
+
+    stub_retrievals["_get_node_data"].assert_not_called()
+    stub_retrievals["_get_edge_data"].assert_not_called()
+    stub_retrievals["_get_vector_context"].assert_not_called()
+    assert result["final_entities"] == []
+    assert result["final_relations"] == []
+    assert result["vector_chunks"] == []
+    assert result["chunk_tracking"] == {}
+
+
+@pytest.mark.asyncio
+async def test_only_global_keywords_in_hybrid_mode(stub_retrievals):
+    result = await _search("hybrid", ll_keywords="")
+
+    stub_retrievals["_get_node_data"].assert_not_called()
+    assert [e["entity_name"] for e in result["final_entities"]] == ["B", "D"]
+    assert result["final_relations"] == GLOBAL_RELATIONS
+
+
+@pytest.mark.asyncio
+async def test_mix_mode_runs_retrievals_concurrently(monkeypatch):
+    # Each stub blocks until all three have started; sequential awaits
+    # would leave the first one waiting forever
+    started = []
+    all_started = asyncio.Event()
+
+    def make_stub(name, result):
+        async def stub(*args, **kwargs):
+            started.append(name)
+            if len(started) == 3:
+                all_started.set()
+            await all_started.wait()
+            return result
+
+        return stub
+
+    monkeypatch.setattr(
+        operate,
+        "_get_node_data",
+        make_stub("local", (list(LOCAL_ENTITIES), list(LOCAL_RELATIONS))),
+    )
+    monkeypatch.setattr(
+        operate,
+        "_get_edge_data",
+        make_stub("global", (list(GLOBAL_RELATIONS), list(GLOBAL_ENTITIES))),
+    )
+    monkeypatch.setattr(
+        operate, "_get_vector_context", make_stub("vector", list(VECTOR_CHUNKS))
+    )
+
+    result = await asyncio.wait_for(_search("mix", chunks_vdb=AsyncMock()), 1)
+
+    assert sorted(started) == ["global", "local", "vector"]
+    assert len(result["final_entities"]) == 4
+    assert len(result["chunk_tracking"]) == 2
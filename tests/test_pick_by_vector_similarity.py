@@ -0,0 +1,79 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lightrag.utils import pick_by_vector_similarity
+
+# Mark all tests as offline (no external dependencies)
+pytestmark = pytest.mark.offline
+
+
+def _make_chunks_vdb(vectors: dict[str, list[float]]) -> MagicMock:
+    chunks_vdb = MagicMock()
+    chunks_vdb.get_vectors_by_ids = AsyncMock(
+        side_effect=lambda ids: {i: vectors[i] for i in ids if i in vectors}
+    )
+    return chunks_vdb
+
+
+@pytest.mark.asyncio
+async def test_pick_by_vector_similarity_ranks_by_cosine():
+    vectors = {
+        "chunk-a": [1.0, 0.0],
+        "chunk-b": [0.0, 1.0],
+        "chunk-c": [2.0, 1.0],
+    }
+
+    selected = await pick_by_vector_similarity(
+        query="q",
+        text_chunks_storage=MagicMock(),
+        chunks_vdb=_make_chunks_vdb(vectors),
+        num_of_chunks=2,
+        entity_info=[{"sorted_chunks": ["chunk-a", "chunk-b", "chunk-c"]}],
+        embedding_func=AsyncMock(),
+        query_embedding=[1.0, 0.1],
+    )
+
+    assert selected == ["chunk-a", "chunk-c"]
+
+
+@pytest.mark.asyncio
+async def test_pick_by_vector_similarity_ranks_zero_vectors_last():
+    vectors = {
+        "chunk-zero": [0.0, 0.0],
+        "chunk-far": [-1.0, 0.0],
+    }
+
+    selected = await pick_by_vector_similarity(
+        query="q",
+        text_chunks_storage=MagicMock(),
+        chunks_vdb=_make_chunks_vdb(vectors),
+        num_of_chunks=2,
+        entity_info=[{"sorted_chunks": ["chunk-zero", "chunk-far"]}],
+        embedding_func=AsyncMock(),
+        query_embedding=[1.0, 0.0],
+    )
+
+    assert selected == ["chunk-far", "chunk-zero"]
+
+
+@pytest.mark.asyncio
+async def test_pick_by_vector_similarity_skips_mismatched_vectors():
+    vectors = {
+        "chunk-a": [1.0, 0.0],
+        "chunk-b": [0.0, 1.0, 0.0],
+        "chunk-c": [0.9, 0.1],
+        "chunk-d": ["not", "numeric"],
+    }
+
+    selected = await pick_by_vector_similarity(
+        query="q",
+        text_chunks_storage=MagicMock(),
+        chunks_vdb=_make_chunks_vdb(vectors),
+        num_of_chunks=3,
+        entity_info=[{"sorted_chunks": ["chunk-b", "chunk-d", "chunk-c", "chunk-a"]}],
+        embedding_func=AsyncMock(),
+        query_embedding=[1.0, 0.0],
+    )
+
+    assert selected == ["chunk-a", "chunk-c"]
@@ -0,0 +1,128 @@
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from lightrag.kg.postgres_impl import PGKVStorage, SQL_TEMPLATES
+from lightrag.namespace import NameSpace
+
+# Mark all tests as offline (no external dependencies)
+pytestmark = pytest.mark.offline
+
+
+def _make_storage(namespace: str) -> tuple[PGKVStorage, AsyncMock]:
+    storage = PGKVStorage.__new__(PGKVStorage)
+    storage.workspace = "test_ws"
+    storage.namespace = namespace
+
+    connection = AsyncMock()
+
+    async def fake_run_with_retry(operation, **kwargs):
+        return await operation(connection)
+
+    storage.db = MagicMock()
+    storage.db.execute = AsyncMock()
+    storage.db._run_with_retry = AsyncMock(side_effect=fake_run_with_retry)
+    return storage, connection
+
+
+@pytest.mark.asyncio
+async def test_kv_upsert_sends_all_records_in_one_executemany():
+    storage, connection = _make_storage(NameSpace.KV_STORE_FULL_DOCS)
+
+    await storage.upsert(
+        {
+            "doc-1": {"content": "first", "file_path": "a.txt"},
+            "doc-2": {"content": "second"},
+        }
+    )
+
+    storage.db.execute.assert_not_called()
+    storage.db._run_with_retry.assert_awaited_once()
+    connection.executemany.assert_awaited_once()
+    sql, values = connection.executemany.await_args.args
+    assert sql == SQL_TEMPLATES["upsert_doc_full"]
+    assert values == [
+        ("doc-1", "first", "a.txt", "test_ws"),
+        ("doc-2", "second", "", "test_ws"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_kv_upsert_text_chunks_tuple_matches_sql_placeholders():
+    storage, connection = _make_storage(NameSpace.KV_STORE_TEXT_CHUNKS)
+
+    await storage.upsert(
+        {
+            "chunk-1": {
+                "tokens": 12,
+                "chunk_order_index": 0,
+                "full_doc_id": "doc-1",
+                "content": "hello",
+                "file_path": "a.txt",
+                "llm_cache_list": ["cache-1"],
+            }
+        }
+    )
+
+    connection.executemany.assert_awaited_once()
+    sql, values = connection.executemany.await_args.args
+    assert sql == SQL_TEMPLATES["upsert_text_chunk"]
+    assert len(values) == 1
+    row = values[0]
+    # Column order of upsert_text_chunk: $1..$10
+    assert row[:8] == (
+        "test_ws",
+        "chunk-1",
+        12,
+        0,
+        "doc-1",
+        "hello",
+        "a.txt",
+        '["cache-1"]',
+    )
+    assert isinstance(row[8], datetime.datetime)
+    assert row[8] == row[9]
+    assert len(row) == sql.count("$")
+
+
+@pytest.mark.asyncio
+async def test_kv_upsert_llm_cache_tuple_matches_sql_placeholders():
+    storage, connection = _make_storage(NameSpace.KV_STORE_LLM_RESPONSE_CACHE)
+
+    await storage.upsert(
+        {
+            "default:extract:abc": {
+                "original_prompt": "prompt",
+                "return": "answer",
+                "chunk_id": "chunk-1",
+                "queryparam": {"mode": "mix"},
+            }
+        }
+    )
+
+    sql, values = connection.executemany.await_args.args
+    assert sql == SQL_TEMPLATES["upsert_llm_response_cache"]
+    # Column order of upsert_llm_response_cache: $1..$7
+    assert values == [
+        (
+            "test_ws",
+            "default:extract:abc",
+            "prompt",
+            "answer",
+            "chunk-1",
+            "extract",
+            '{"mode": "mix"}',
+        )
+    ]
+    assert len(values[0]) == sql.count("$")
+
+
+@pytest.mark.asyncio
+async def test_kv_upsert_empty_data_skips_database():
+    storage, connection = _make_storage(NameSpace.KV_STORE_FULL_DOCS)
+
+    await storage.upsert({})
+
+    storage.db._run_with_retry.assert_not_called()
+    connection.executemany.assert_not_called()
@@ -0,0 +1,150 @@
+import logging
+import logging.handlers
+
+import pytest
+
+from lightrag.utils import (
+    LightragPathFilter,
+    install_queue_logging,
+    stop_queue_logging,
+)
+
+# Mark all tests as offline (no external dependencies)
+pytestmark = pytest.mark.offline
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+@pytest.fixture
+def scratch_logger():
+    logger = logging.getLogger("lightrag.test_queue_logging")
+    logger.handlers = []
+    logger.filters = []
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    yield logger
+    stop_queue_logging()
+    logger.handlers = []
+    logger.filters = []
+
+
+def test_install_swaps_handler_and_delivers_after_stop(scratch_logger):
+    target = _ListHandler()
+    scratch_logger.addHandler(target)
+
+    install_queue_logging([scratch_logger.name])
+
+    assert len(scratch_logger.handlers) == 1
+    assert isinstance(scratch_logger.handlers[0], logging.handlers.QueueHandler)
+
+    scratch_logger.info("hello %s", "queue")
+    stop_queue_logging()
+
+    assert [r.getMessage() for r in target.records] == ["hello queue"]
+
+
+def test_logger_filter_runs_before_enqueue(scratch_logger):
+    target = _ListHandler()
+    scratch_logger.addHandler(target)
+    scratch_logger.addFilter(LightragPathFilter())
+
+    install_queue_logging([scratch_logger.name])
+
+    # Access-log shaped records: (client, method, path, http_version, status)
+    scratch_logger.info('%s - "%s %s HTTP/%s" %d', "ip", "GET", "/health", "1.1", 200)
+    scratch_logger.info('%s - "%s %s HTTP/%s" %d', "ip", "GET", "/query", "1.1", 200)
+    stop_queue_logging()
+
+    assert [r.getMessage() for r in target.records] == [
+        'ip - "GET /query HTTP/1.1" 200'
+    ]
+
+
+def test_loggers_with_separate_handlers_do_not_cross_deliver():
+    first = logging.getLogger("lightrag.test_queue_logging.first")
+    second = logging.getLogger("lightrag.test_queue_logging.second")
+    first_target, second_target = _ListHandler(), _ListHandler()
+    for logger, target in ((first, first_target), (second, second_target)):
+        logger.handlers = [target]
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    try:
+        install_queue_logging([first.name, second.name])
+
+        first.info("one")
+        second.info("two")
+        stop_queue_logging()
+
+        assert [r.getMessage() for r in first_target.records] == ["one"]
+        assert [r.getMessage() for r in second_target.records] == ["two"]
+    finally:
+        stop_queue_logging()
+        first.handlers = []
+        second.handlers = []
+
+
+def test_records_logged_after_stop_reach_original_handler(scratch_logger):
+    target = _ListHandler()
+    scratch_logger.addHandler(target)
+
+    install_queue_logging([scratch_logger.name])
+    stop_queue_logging()
+
+    assert target in scratch_logger.handlers
+    scratch_logger.info("after stop")
+
+    assert [r.getMessage() for r in target.records] == ["after stop"]
+
+
+def test_second_install_restores_previously_queued_logger():
+    first = logging.getLogger("lightrag.test_queue_logging.first")
+    second = logging.getLogger("lightrag.test_queue_logging.second")
+    first_target, second_target = _ListHandler(), _ListHandler()
+    for logger, target in ((first, first_target), (second, second_target)):
+        logger.handlers = [target]
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+    try:
+        install_queue_logging([first.name])
+        install_queue_logging([second.name])
+
+        assert first_target in first.handlers
+        first.info("first after reinstall")
+        second.info("second queued")
+        stop_queue_logging()
+        second.info("second after stop")
+
+        assert [r.getMessage() for r in first_target.records] == [
+            "first after reinstall"
+        ]
+        assert [r.getMessage() for r in second_target.records] == [
+            "second queued",
+            "second after stop",
+        ]
+    finally:
+        stop_queue_logging()
+        first.handlers = []
+        second.handlers = []
+
+
+def test_stop_keeps_handlers_reconfigured_after_install(scratch_logger):
+    scratch_logger.addHandler(_ListHandler())
+    install_queue_logging([scratch_logger.name])
+
+    replacement = _ListHandler()
+    scratch_logger.handlers = [replacement]
+    stop_queue_logging()
+
+    assert replacement in scratch_logger.handlers
+    assert not any(
+        isinstance(h, logging.handlers.QueueHandler) for h in scratch_logger.handlers
+    )
@@ -0,0 +1,166 @@
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("redis")
+
+from lightrag.base import DocStatus
+from lightrag.kg.redis_impl import RedisDocStatusStorage, RedisKVStorage
+
+# Mark all tests as offline (no external dependencies)
+pytestmark = pytest.mark.offline
+
+
+def _make_storage(storage_cls, namespace: str):
+    storage = storage_cls.__new__(storage_cls)
+    storage.workspace = "test_ws"
+    storage.namespace = namespace
+    storage.final_namespace = f"test_ws_{namespace}"
+    storage._redis = AsyncMock()
+    return storage, storage._redis
+
+
+def _doc(status: str, **extra) -> str:
+    return json.dumps(
+        {
+            "content_summary": "summary",
+            "content_length": 7,
+            "file_path": "a.txt",
+            "status": status,
+            "created_at": "2025-01-01T00:00:00",
+            "updated_at": "2025-01-01T00:00:00",
+            **extra,
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_kv_get_by_ids_uses_one_mget_in_order():
+    storage, redis = _make_storage(RedisKVStorage, "text_chunks")
+    redis.mget.return_value = [
+        json.dumps({"content": "second"}),
+        None,
+        json.dumps({"content": "first", "create_time": 5}),
+    ]
+
+    results = await storage.get_by_ids(["b", "missing", "a"])
+
+    redis.mget.assert_awaited_once_with(
+        [
+            "test_ws_text_chunks:b",
+            "test_ws_text_chunks:missing",
+            "test_ws_text_chunks:a",
+        ]
+    )
+    assert results == [
+        {"content": "second", "create_time": 0, "update_time": 0},
+        None,
+        {"content": "first", "create_time": 5, "update_time": 0},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("storage_cls", [RedisKVStorage, RedisDocStatusStorage])
+async def test_get_by_ids_empty_skips_mget(storage_cls):
+    storage, redis = _make_storage(storage_cls, "ns")
+
+    assert await storage.get_by_ids([]) == []
+    redis.mget.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_doc_status_get_by_ids_keeps_missing_as_none():
+    storage, redis = _make_storage(RedisDocStatusStorage, "doc_status")
+    redis.mget.return_value = [None, _doc("processed"), "not json"]
+
+    results = await storage.get_by_ids(["missing", "doc-1", "broken"])
+
+    redis.mget.assert_awaited_once_with(
+        [
+            "test_ws_doc_status:missing",
+            "test_ws_doc_status:doc-1",
+            "test_ws_doc_status:broken",
+        ]
+    )
+    assert results[0] is None
+    assert results[1]["status"] == "processed"
+    assert results[2] is None
+
+
+def _scan_pages(redis, pages):
+    """Serve SCAN pages of keys and the matching MGET values per page."""
+    cursors = list(range(1, len(pages))) + [0]
+    redis.scan.side_effect = [(c, list(keys)) for c, (keys, _) in zip(cursors, pages)]
+    redis.mget.side_effect = [list(values) for _, values in pages]
+
+
+@pytest.mark.asyncio
+async def test_scan_reads_mget_each_page_and_skip_missing_values():
+    storage, redis = _make_storage(RedisDocStatusStorage, "doc_status")
+    _scan_pages(
+        redis,
+        [
+            (
+                ["test_ws_doc_status:doc-1", "test_ws_doc_status:gone"],
+                [_doc("processed", track_id="t1"), None],
+            ),
+            (["test_ws_doc_status:doc-2"], [_doc("failed", track_id="t1")]),
+        ],
+    )
+
+    docs = await storage.get_docs_by_track_id("t1")
+
+    assert [call.args[0] for call in redis.mget.await_args_list] == [
+        ["test_ws_doc_status:doc-1", "test_ws_doc_status:gone"],
+        ["test_ws_doc_status:doc-2"],
+    ]
+    assert list(docs) == ["doc-1", "doc-2"]
+    assert docs["doc-1"].status == DocStatus.PROCESSED
+
+
+@pytest.mark.asyncio
+async def test_status_counts_and_status_filter_skip_missing_values():
+    storage, redis = _make_storage(RedisDocStatusStorage, "doc_status")
+    page = (
+        [
+            "test_ws_doc_status:doc-1",
+            "test_ws_doc_status:gone",
+            "test_ws_doc_status:doc-2",
+        ],
+        [_doc("processed"), None, _doc("failed")],
+    )
+
+    _scan_pages(redis, [page])
+    counts = await storage.get_status_counts()
+    assert counts["processed"] == 1
+    assert counts["failed"] == 1
+
+    _scan_pages(redis, [page])
+    docs = await storage.get_docs_by_status(DocStatus.FAILED)
+    assert list(docs) == ["doc-2"]
+
+    _scan_pages(redis, [page])
+    paginated, total = await storage.get_docs_paginated(sort_field="id")
+    assert total == 2
+    assert [doc_id for doc_id, _ in paginated] == ["doc-2", "doc-1"]
+
+
+@pytest.mark.asyncio
+async def test_get_doc_by_file_path_stops_at_first_match():
+    storage, redis = _make_storage(RedisDocStatusStorage, "doc_status")
+    _scan_pages(
+        redis,
+        [
+            (
+                ["test_ws_doc_status:gone", "test_ws_doc_status:doc-1"],
+                [None, _doc("processed", file_path="wanted.txt")],
+            ),
+            (["test_ws_doc_status:doc-2"], [_doc("processed")]),
+        ],
+    )
+
+    doc = await storage.get_doc_by_file_path("wanted.txt")
+
+    assert doc["file_path"] == "wanted.txt"
+    redis.mget.assert_awaited_once()